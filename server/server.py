@@ -13,21 +13,51 @@ Endpoints:
 """
 
 import os
-import json
-import time
+import mmap
+import asyncio
+import logging
 import hashlib
-import requests
 import random
-from typing import Optional, List
+import string
+import secrets
+import tempfile
+import threading
+import httpx
+import orjson
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Optional, List, Dict, Set
 from fastapi import FastAPI, UploadFile, File, Form, HTTPException, Body, Request
-from fastapi.responses import JSONResponse, FileResponse, RedirectResponse
-from pydantic import BaseModel
+from fastapi.responses import JSONResponse, FileResponse, RedirectResponse, Response
+from pydantic import BaseModel, Field
 from pathlib import Path
 
 # -- CORS IMPORT --
 from fastapi.middleware.cors import CORSMiddleware
 
-app = FastAPI()
+logger = logging.getLogger(__name__)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Startup checks and shared resources for the lifetime of the server."""
+    check_sha256_backend()
+    # Shared client so contributor verifications reuse pooled keep-alive connections
+    app.state.http = httpx.AsyncClient(
+        http2=True,
+        timeout=10,
+        follow_redirects=True,
+        limits=httpx.Limits(max_keepalive_connections=100)
+    )
+    flusher = asyncio.create_task(flush_periodically())
+    try:
+        yield
+    finally:
+        flusher.cancel()
+        # Write out anything changed since the last flush
+        await asyncio.to_thread(flush_all)
+        await app.state.http.aclose()
+
+app = FastAPI(lifespan=lifespan)
 
 # Allow all CORS origins
 app.add_middleware(
@@ -43,6 +73,13 @@ DATA_DIR = Path("data")
 DATASETS_FOLDER = DATA_DIR / "datasets"
 DATASETS_JSON = DATA_DIR / "datasets.json"
 CONTRIB_JSON = DATA_DIR / "contributors.json"
+CHUNK_SIZE = 1 << 20  # 1 MiB read size when streaming uploads
+PREFIX_SIZE = 64 << 10  # Leading bytes hashed separately for the contributor pre-check
+RANGE_PART_SIZE = 8 << 20  # Bytes per ranged GET when downloading contributor files
+RANGE_CONCURRENCY = 4  # Ranged GETs in flight at once
+FLUSH_INTERVAL = 0.1  # Seconds between background flushes of in-memory edits
+# Lowercases ASCII letters and turns spaces into dashes in one str.translate pass
+SLUG_TABLE = str.maketrans(string.ascii_uppercase + " ", string.ascii_lowercase + "-")
 
 # Make sure directories exist
 DATA_DIR.mkdir(exist_ok=True)
@@ -53,10 +90,14 @@ class Dataset(BaseModel):
     id: str
     title: str
     description: str
-    hash: str
+    hash: str = Field(frozen=True)  # Computed once while streaming the upload; never recomputed
     verifiedContributorHosts: int
     originalFilename: str
     filenameOnDisk: str  # The actual filename we store locally (includes extension)
+    # Size in bytes and SHA-256 of the first PREFIX_SIZE bytes, used to reject
+    # mismatched contributor files cheaply (absent for datasets uploaded before these existed)
+    size: Optional[int] = None
+    prefixHash: Optional[str] = None
 
 class Contributor(BaseModel):
     datasetId: str
@@ -65,40 +106,413 @@ class Contributor(BaseModel):
     hostLink: str
 
 
+# -------------- CACHE --------------
+# Parsed contents of the JSON index files, reused until the file's mtime changes.
+# "raw" holds the plain-dict form of "data" so it can be re-serialized directly
+# (None when it must be rebuilt), and "body" the encoded /api/datasets response.
+# "pending" holds changes made in memory that the background flusher hasn't
+# written yet (dataset id -> changed fields, or added contributors). They are
+# re-applied whenever the file is re-read, so another worker's writes aren't lost.
+_DS_CACHE = {"mtime": 0, "data": [], "raw": [], "body": None, "pending": {}}
+_CONTRIB_CACHE = {"mtime": 0, "data": [], "raw": [], "pending": []}
+_DS_BY_ID: Dict[str, Dataset] = {}
+# Contributors grouped by dataset id, and the set of emails per dataset id
+_CONTRIB_BY_DS: Dict[str, List[Contributor]] = {}
+_CONTRIB_EMAILS: Dict[str, Set[str]] = {}
+# SHA-256 of the bytes currently in each JSON file, so unchanged saves can be skipped
+_JSON_DIGESTS: Dict[Path, str] = {}
+_JSON_WRITE_LOCK = threading.Lock()
+# Guards the in-memory dataset/contributor state shared by handlers and the flusher.
+# It is held across disk writes, so async handlers only take it via asyncio.to_thread.
+_STORE_LOCK = threading.RLock()
+
+
 # -------------- UTILS --------------
-def compute_sha256(file_bytes: bytes) -> str:
-    """Compute SHA-256 hex digest of given bytes."""
-    return hashlib.sha256(file_bytes).hexdigest()
+def check_sha256_backend() -> None:
+    """
+    Confirm hashlib's SHA-256 comes from OpenSSL (_hashlib) rather than the
+    builtin _sha256 fallback, and warn if the CPU lacks the SHA-NI extension
+    that OpenSSL's assembly uses to accelerate it.
+    """
+    backend = type(hashlib.new("sha256")).__module__
+    if backend != "_hashlib":
+        logger.warning(
+            "hashlib sha256 is using the %s fallback, not OpenSSL; "
+            "hashing uploads and contributor files will be slow.", backend
+        )
+
+    try:
+        cpuinfo = Path("/proc/cpuinfo").read_text()
+    except OSError:
+        # Not Linux (or /proc unavailable); nothing to probe
+        return
+    # Only x86 reports a "flags" line with sha_ni; other architectures (e.g. ARM's
+    # "Features: ... sha2") advertise SHA extensions differently, so don't warn there
+    flags = [line for line in cpuinfo.splitlines() if line.startswith("flags")]
+    if flags and not any("sha_ni" in line.split() for line in flags):
+        logger.warning("CPU does not report sha_ni; SHA-256 will use OpenSSL's non-SHA-NI code path.")
+
+async def fetch_range(client: httpx.AsyncClient, url: str, start: int, end: int) -> Optional[bytes]:
+    """
+    Download bytes start..end (inclusive) of a URL.
+    Returns None, without reading the body, if the host doesn't answer 206.
+    """
+    headers = {"Range": f"bytes={start}-{end}", "Accept-Encoding": "identity"}
+    async with client.stream("GET", url, headers=headers) as r:
+        if r.status_code != 206:
+            return None
+        expected = end - start + 1
+        part = bytearray()
+        async for chunk in r.aiter_bytes():
+            part += chunk
+            if len(part) > expected:
+                break
+    if len(part) != expected:
+        raise ValueError("Host returned the wrong number of bytes for a range request")
+    return bytes(part)
+
+async def hash_ranges(client: httpx.AsyncClient, url: str, size: int) -> Optional[str]:
+    """
+    Hash a URL of known size by downloading it as concurrent ranged GETs,
+    hashing the parts strictly in order as each arrives.
+    Returns None if the host turns out not to honour ranges.
+    """
+    h = hashlib.sha256()
+    pending = deque()
+    next_start = 0
+    try:
+        while next_start < size or pending:
+            # Keep RANGE_CONCURRENCY parts downloading while we hash the oldest
+            while next_start < size and len(pending) < RANGE_CONCURRENCY:
+                end = min(next_start + RANGE_PART_SIZE, size) - 1
+                pending.append(asyncio.create_task(fetch_range(client, url, next_start, end)))
+                next_start = end + 1
+            part = await pending.popleft()
+            if part is None:
+                return None
+            await asyncio.to_thread(h.update, part)
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+    return h.hexdigest()
+
+async def prefix_matches(client: httpx.AsyncClient, url: str, ds: Dataset) -> bool:
+    """
+    Cheaply check a hosted file against a dataset's stored size and prefix hash
+    by fetching only its first PREFIX_SIZE bytes. This is only an early reject:
+    it returns True whenever it can't decide (no stored prefix, an empty
+    dataset, or a non-2xx answer to the probe) and leaves that to the full hash.
+    """
+    if ds.prefixHash is None or ds.size is None or ds.size == 0:
+        return True
+
+    h = hashlib.sha256()
+    remaining = PREFIX_SIZE
+    headers = {"Range": f"bytes=0-{PREFIX_SIZE - 1}", "Accept-Encoding": "identity"}
+    async with client.stream("GET", url, headers=headers) as r:
+        if not r.is_success:
+            # Some hosts refuse ranged requests but serve plain GETs; let the full hash decide
+            return True
+        if r.status_code == 206:
+            total = r.headers.get("content-range", "").rpartition("/")[2]
+        elif r.headers.get("content-encoding", "identity") == "identity":
+            # Host ignored the Range header; the full length is still comparable
+            total = r.headers.get("content-length", "")
+        else:
+            total = ""
+        if total.isdigit() and int(total) != ds.size:
+            return False
+
+        async for chunk in r.aiter_bytes():
+            piece = chunk[:remaining]
+            h.update(piece)
+            remaining -= len(piece)
+            if remaining <= 0:
+                break
+    return h.hexdigest() == ds.prefixHash
+
+async def fetch_sha256(client: httpx.AsyncClient, url: str) -> str:
+    """
+    Download a URL and return the SHA-256 hex digest of its body.
+    Large files on hosts that accept byte ranges are fetched as several
+    concurrent ranged GETs, hashed in order as each part arrives; anything
+    else is streamed over a single GET.
+    """
+    head = await client.head(url, headers={"Accept-Encoding": "identity"})
+    size = int(head.headers.get("content-length") or 0)
+    if (
+        head.is_success
+        and head.headers.get("accept-ranges") == "bytes"
+        and head.headers.get("content-encoding", "identity") == "identity"
+        and size > RANGE_PART_SIZE
+    ):
+        digest = await hash_ranges(client, str(head.url), size)  # after any redirects
+        if digest is not None:
+            return digest
+        # Advertised ranges but didn't honour them; fall back to a single GET
+
+    h = hashlib.sha256()
+    async with client.stream("GET", url) as r:
+        r.raise_for_status()
+        async for chunk in r.aiter_bytes(CHUNK_SIZE):
+            # OpenSSL releases the GIL on large updates, so hash off the event loop
+            await asyncio.to_thread(h.update, chunk)
+    return h.hexdigest()
+
+def slugify(title: str) -> str:
+    """Turn a dataset title into the readable prefix of its id."""
+    return title.translate(SLUG_TABLE)
+
+def file_mtime(path: Path) -> int:
+    """Return a file's mtime in nanoseconds, or 0 if it doesn't exist."""
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return 0
+
+def read_json(path: Path) -> list:
+    """
+    Parse a JSON index file, remembering the digest of its contents.
+    The file is memory-mapped so it is parsed straight from the page cache
+    (shared between workers) without copying it into a bytes object first.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # Empty files can't be mapped; let orjson report the error
+            return orjson.loads(b"")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            _JSON_DIGESTS[path] = hashlib.sha256(view).hexdigest()
+            return orjson.loads(view)
+
+def write_json(path: Path, data: list) -> Optional[int]:
+    """
+    Write a JSON index file atomically (fsynced unique temp file + os.replace),
+    skipping the write entirely if the serialized bytes are unchanged.
+    Returns the written file's mtime in nanoseconds, or None if skipped.
+    """
+    content = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    digest = hashlib.sha256(content).hexdigest()
+    with _JSON_WRITE_LOCK:
+        if _JSON_DIGESTS.get(path) == digest:
+            return None
+        # Unique temp name so concurrent workers never write the same temp file
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                # mkstemp creates the file 0600; keep the index's usual permissions
+                os.fchmod(f.fileno(), path.stat().st_mode & 0o777 if path.exists() else 0o644)
+                f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+                # Taken from our own file, so we never adopt another process's mtime
+                mtime = os.fstat(f.fileno()).st_mtime_ns
+            os.replace(tmp_path, path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+        _JSON_DIGESTS[path] = digest
+        return mtime
+
+def set_datasets_cache(datasets: List[Dataset], raw: List[dict], mtime: int) -> None:
+    """Replace the cached dataset list and rebuild the by-id index."""
+    global _DS_BY_ID
+    _DS_CACHE["mtime"] = mtime
+    _DS_CACHE["data"] = datasets
+    _DS_CACHE["raw"] = raw
+    _DS_CACHE["body"] = None
+    _DS_BY_ID = {d.id: d for d in datasets}
 
 def load_datasets() -> List[Dataset]:
-    """Load datasets from local datasets.json."""
-    if not DATASETS_JSON.exists():
-        return []
-    with open(DATASETS_JSON, "r", encoding="utf-8") as f:
-        arr = json.load(f)
-        return [Dataset(**item) for item in arr]
+    """Load datasets from local datasets.json (re-parsed only when the file changes)."""
+    with _STORE_LOCK:
+        mtime = file_mtime(DATASETS_JSON)
+        if mtime != _DS_CACHE["mtime"]:
+            raw = read_json(DATASETS_JSON) if mtime else []
+            # We wrote this file ourselves, so skip re-validating every record
+            set_datasets_cache([Dataset.model_construct(**item) for item in raw], raw, mtime)
+            reapply_pending_datasets()
+        return list(_DS_CACHE["data"])
+
+def reapply_pending_datasets() -> None:
+    """Re-apply unflushed dataset edits on top of a freshly re-read datasets.json."""
+    pending = _DS_CACHE["pending"]
+    if not pending:
+        return
+    for dataset_id, changes in list(pending.items()):
+        ds = _DS_BY_ID.get(dataset_id)
+        if ds is None:
+            # Deleted by another worker; nothing left to edit
+            del pending[dataset_id]
+            continue
+        for field, value in changes.items():
+            if field == "verifiedContributorHosts":
+                # Other workers may have added contributors too; recount from the merged list
+                value = len(contributors_for_dataset(dataset_id))
+            setattr(ds, field, value)
+    _DS_CACHE["raw"] = None
+    _DS_CACHE["body"] = None
 
 def save_datasets(datasets: List[Dataset]) -> None:
     """Save datasets to local datasets.json."""
-    with open(DATASETS_JSON, "w", encoding="utf-8") as f:
-        json.dump([d.dict() for d in datasets], f, indent=2)
+    with _STORE_LOCK:
+        # Serialize under the lock so a concurrent in-place edit can't be dropped
+        raw = [d.model_dump() for d in datasets]
+        mtime = write_json(DATASETS_JSON, raw)
+        set_datasets_cache(list(datasets), raw, _DS_CACHE["mtime"] if mtime is None else mtime)
+        # Callers pass a list built from load_datasets, so pending edits are now on disk
+        _DS_CACHE["pending"] = {}
+
+def add_dataset(ds: Dataset) -> None:
+    """Append a dataset and save datasets.json as one locked read-modify-write."""
+    with _STORE_LOCK:
+        datasets = load_datasets()
+        datasets.append(ds)
+        save_datasets(datasets)
+
+def update_dataset(ds: Dataset, **changes) -> None:
+    """
+    Apply field changes to a cached dataset in place.
+    The background flusher writes them to datasets.json shortly after.
+    """
+    with _STORE_LOCK:
+        for field, value in changes.items():
+            setattr(ds, field, value)
+        _DS_CACHE["pending"].setdefault(ds.id, {}).update(changes)
+        _DS_CACHE["raw"] = None
+        _DS_CACHE["body"] = None
+
+def flush_datasets() -> None:
+    """Write in-place dataset edits to datasets.json if there are any."""
+    with _STORE_LOCK:
+        if not _DS_CACHE["pending"]:
+            return
+        # Re-reads the file first if another worker changed it, keeping our edits on top
+        raw = load_dataset_dicts()
+        mtime = write_json(DATASETS_JSON, raw)
+        if mtime is not None:
+            _DS_CACHE["mtime"] = mtime
+        _DS_CACHE["pending"] = {}
 
 def load_contributors() -> List[Contributor]:
-    """Load contributors from local contributors.json."""
-    if not CONTRIB_JSON.exists():
-        return []
-    with open(CONTRIB_JSON, "r", encoding="utf-8") as f:
-        arr = json.load(f)
-        return [Contributor(**item) for item in arr]
-
-def save_contributors(contribs: List[Contributor]) -> None:
-    """Save contributors to local contributors.json."""
-    with open(CONTRIB_JSON, "w", encoding="utf-8") as f:
-        json.dump([c.dict() for c in contribs], f, indent=2)
-
-def find_dataset_by_id(dataset_id: str, datasets: List[Dataset]) -> Optional[Dataset]:
-    """Helper to find a dataset from the list by ID."""
-    return next((d for d in datasets if d.id == dataset_id), None)
+    """Load contributors from local contributors.json (re-parsed only when the file changes)."""
+    with _STORE_LOCK:
+        mtime = file_mtime(CONTRIB_JSON)
+        if mtime != _CONTRIB_CACHE["mtime"]:
+            global _CONTRIB_BY_DS, _CONTRIB_EMAILS
+            raw = read_json(CONTRIB_JSON) if mtime else []
+            contribs = [Contributor.model_construct(**item) for item in raw]
+            by_ds, emails = {}, {}
+            for c in contribs:
+                by_ds.setdefault(c.datasetId, []).append(c)
+                emails.setdefault(c.datasetId, set()).add(c.email)
+            _CONTRIB_CACHE["mtime"] = mtime
+            _CONTRIB_CACHE["data"] = contribs
+            _CONTRIB_CACHE["raw"] = raw
+            _CONTRIB_BY_DS, _CONTRIB_EMAILS = by_ds, emails
+
+            # Re-apply unflushed additions that another worker's rewrite doesn't already have
+            pending = [c for c in _CONTRIB_CACHE["pending"] if c.email not in emails.get(c.datasetId, ())]
+            for c in pending:
+                index_contributor(c)
+            _CONTRIB_CACHE["pending"] = pending
+        return list(_CONTRIB_CACHE["data"])
+
+def index_contributor(contrib: Contributor) -> None:
+    """Append a contributor to the cached list, its dict form, and the per-dataset indexes."""
+    _CONTRIB_CACHE["data"].append(contrib)
+    # Contributors are never edited, so the cached dicts stay current
+    _CONTRIB_CACHE["raw"].append(contrib.model_dump())
+    _CONTRIB_BY_DS.setdefault(contrib.datasetId, []).append(contrib)
+    _CONTRIB_EMAILS.setdefault(contrib.datasetId, set()).add(contrib.email)
+
+def add_contributor(contrib: Contributor) -> None:
+    """
+    Append a contributor to the cache and its per-dataset indexes.
+    The background flusher writes it to contributors.json shortly after.
+    """
+    with _STORE_LOCK:
+        load_contributors()
+        index_contributor(contrib)
+        _CONTRIB_CACHE["pending"].append(contrib)
+
+def flush_contributors() -> None:
+    """Write newly added contributors to contributors.json if there are any."""
+    with _STORE_LOCK:
+        if not _CONTRIB_CACHE["pending"]:
+            return
+        # Re-reads the file first if another worker changed it, keeping our additions
+        load_contributors()
+        mtime = write_json(CONTRIB_JSON, _CONTRIB_CACHE["raw"])
+        if mtime is not None:
+            _CONTRIB_CACHE["mtime"] = mtime
+        _CONTRIB_CACHE["pending"] = []
+
+def flush_all() -> None:
+    """Write all pending in-memory changes (datasets and contributors) to disk together."""
+    with _STORE_LOCK:
+        flush_datasets()
+        flush_contributors()
+
+async def flush_periodically() -> None:
+    """Background task that coalesces pending in-memory changes into one write per FLUSH_INTERVAL."""
+    while True:
+        await asyncio.sleep(FLUSH_INTERVAL)
+        try:
+            await asyncio.to_thread(flush_all)
+        except Exception:
+            logger.exception("Failed to flush datasets/contributors to disk")
+
+def contributors_for_dataset(dataset_id: str) -> List[Contributor]:
+    """Return the contributors registered for a dataset."""
+    load_contributors()
+    return _CONTRIB_BY_DS.get(dataset_id, [])
+
+def is_contributor(dataset_id: str, email: str) -> bool:
+    """Check whether an email is already a contributor for a dataset."""
+    load_contributors()
+    return email in _CONTRIB_EMAILS.get(dataset_id, ())
+
+def find_dataset_by_id(dataset_id: str) -> Optional[Dataset]:
+    """Helper to find a dataset by ID via the cached index."""
+    load_datasets()
+    return _DS_BY_ID.get(dataset_id)
+
+def register_contributor(contrib: Contributor) -> Optional[Dataset]:
+    """
+    Add a verified contributor (unless that email is already registered for the
+    dataset) and update the dataset's count, as one in-memory update under the
+    store lock; the flusher writes both files together.
+    Returns the dataset, or None if it no longer exists.
+    """
+    with _STORE_LOCK:
+        ds = find_dataset_by_id(contrib.datasetId)
+        if not ds:
+            return None
+
+        if not is_contributor(contrib.datasetId, contrib.email):
+            add_contributor(contrib)
+
+        verified_count = len(contributors_for_dataset(contrib.datasetId))
+        if ds.verifiedContributorHosts != verified_count:
+            update_dataset(ds, verifiedContributorHosts=verified_count)
+        return ds
+
+def load_dataset_dicts() -> List[dict]:
+    """Like load_datasets, but returns the cached plain-dict form of each dataset."""
+    with _STORE_LOCK:
+        load_datasets()
+        if _DS_CACHE["raw"] is None:
+            _DS_CACHE["raw"] = [d.model_dump() for d in _DS_CACHE["data"]]
+        return _DS_CACHE["raw"]
+
+def load_datasets_body() -> bytes:
+    """Return the JSON-encoded dataset list, encoded once per change to the datasets."""
+    with _STORE_LOCK:
+        raw = load_dataset_dicts()
+        if _DS_CACHE["body"] is None:
+            _DS_CACHE["body"] = orjson.dumps(raw)
+        return _DS_CACHE["body"]
 
 def delete_local_file(filename_on_disk: str):
     """Delete the local file for a dataset if it exists."""
@@ -115,8 +529,11 @@ def get_all_datasets():
     Get the list of all datasets (metadata only).
     The front-end can use this to display available datasets.
     """
-    datasets = load_datasets()
-    return [d.dict() for d in datasets]
+    # Pre-encoded bytes; skips FastAPI's encoder and re-serializing on every poll
+    return Response(
+        content=load_datasets_body(),
+        media_type="application/json"
+    )
 
 
 @app.post("/api/uploadDataset")
@@ -129,8 +546,7 @@ async def upload_dataset(
     City Admin uploads a new dataset (multipart/form-data).
     - Compute the unique dataset_id
     - Preserve the original file extension
-    - Save to local data/datasets/filenameOnDisk
-    - Compute hash
+    - Save to local data/datasets/filenameOnDisk, computing the hash in the same pass
     - Add to datasets.json
     """
     if not title.strip():
@@ -138,11 +554,8 @@ async def upload_dataset(
     if not description.strip():
         raise HTTPException(status_code=400, detail="Description is required.")
 
-    # Read entire file contents
-    file_bytes = await file.read()
-
-    # Compute a unique dataset_id
-    dataset_id = f"{title.lower().replace(' ', '-')}-{int(time.time())}"
+    # Compute a unique dataset_id (random suffix, so same-second uploads can't collide)
+    dataset_id = f"{slugify(title)}-{secrets.token_urlsafe(6)}"
 
     # Extract the original extension (if any)
     original_extension = Path(file.filename).suffix or ""
@@ -153,13 +566,20 @@ async def upload_dataset(
     # We'll store the file as <dataset_id><original_extension>
     filename_on_disk = f"{dataset_id}{original_extension}"
 
-    # Save the file locally
+    # Stream the upload to disk, hashing each chunk as it is written
     dataset_path = DATASETS_FOLDER / filename_on_disk
+    h = hashlib.sha256()
+    prefix_h = hashlib.sha256()
+    size = 0
     with open(dataset_path, "wb") as out_f:
-        out_f.write(file_bytes)
-
-    # Compute hash of uploaded bytes
-    file_hash = compute_sha256(file_bytes)
+        while chunk := await file.read(CHUNK_SIZE):
+            h.update(chunk)
+            if size < PREFIX_SIZE:
+                prefix_h.update(chunk[:PREFIX_SIZE - size])
+            size += len(chunk)
+            # Blocking disk write goes to a worker thread so other requests keep running
+            await asyncio.to_thread(out_f.write, chunk)
+    file_hash = h.hexdigest()
 
     new_dataset = Dataset(
         id=dataset_id,
@@ -168,13 +588,13 @@ async def upload_dataset(
         hash=file_hash,
         verifiedContributorHosts=0,
         originalFilename=file.filename or f"{dataset_id}{original_extension}",
-        filenameOnDisk=filename_on_disk
+        filenameOnDisk=filename_on_disk,
+        size=size,
+        prefixHash=prefix_h.hexdigest()
     )
 
-    # Append to our list of datasets
-    datasets = load_datasets()
-    datasets.append(new_dataset)
-    save_datasets(datasets)
+    # Append to our list of datasets (on a worker thread; it takes the store lock)
+    await asyncio.to_thread(add_dataset, new_dataset)
 
     return {
         "message": "Dataset uploaded successfully.",
@@ -195,24 +615,19 @@ def edit_dataset(body: dict = Body(...)):
     new_title = body.get("title")
     new_desc = body.get("description")
 
-    datasets = load_datasets()
-    ds = find_dataset_by_id(dataset_id, datasets)
-    if not ds:
-        raise HTTPException(status_code=404, detail="Dataset not found")
-
-    if new_title is not None:
-        ds.title = new_title
-    if new_desc is not None:
-        ds.description = new_desc
+    with _STORE_LOCK:
+        ds = find_dataset_by_id(dataset_id)
+        if not ds:
+            raise HTTPException(status_code=404, detail="Dataset not found")
 
-    # Save changes back
-    # (Replace the old dataset object in the list)
-    for i, item in enumerate(datasets):
-        if item.id == dataset_id:
-            datasets[i] = ds
-            break
+        # Edit the cached object in place; the flusher persists it
+        changes = {}
+        if new_title is not None:
+            changes["title"] = new_title
+        if new_desc is not None:
+            changes["description"] = new_desc
+        update_dataset(ds, **changes)
 
-    save_datasets(datasets)
     return {"message": "Dataset updated"}
 
 
@@ -223,31 +638,33 @@ def delete_dataset(dataset_id: str):
       - Remove from datasets.json
       - Delete the local file if it exists
     """
-    datasets = load_datasets()
-    ds = find_dataset_by_id(dataset_id, datasets)
-    if not ds:
-        raise HTTPException(status_code=404, detail="Dataset not found")
+    # Hold the store lock so a concurrent upload or edit can't be lost (or undo the delete)
+    with _STORE_LOCK:
+        datasets = load_datasets()
+        ds = find_dataset_by_id(dataset_id)
+        if not ds:
+            raise HTTPException(status_code=404, detail="Dataset not found")
 
-    # Remove from the list
-    updated = [d for d in datasets if d.id != dataset_id]
+        # Remove from the list
+        updated = [d for d in datasets if d.id != dataset_id]
 
-    # Delete the local file
-    delete_local_file(ds.filenameOnDisk)
+        # Delete the local file
+        delete_local_file(ds.filenameOnDisk)
 
-    # Save updated list to JSON
-    save_datasets(updated)
+        # Save updated list to JSON
+        save_datasets(updated)
 
     return {"message": f"Dataset {dataset_id} deleted"}
 
 
 @app.post("/api/contribute")
-def contribute(body: dict = Body(...)):
+async def contribute(body: dict = Body(...)):
     """
     A user registers as a known contributor for a dataset.
     Expect JSON: { datasetId, name, email, hostLink }
     Steps:
       1) Verify dataset exists
-      2) Download hostLink, compute hash, compare
+      2) Check hostLink's size and first block, then download it, compute hash, compare
       3) If valid, add to contributors.json
       4) Increase dataset's verifiedContributorHosts
       5) If verifiedContributorHosts >= 5, delete local file
@@ -260,44 +677,30 @@ def contribute(body: dict = Body(...)):
     if not all([dataset_id, name, email, host_link]):
         raise HTTPException(status_code=400, detail="Missing fields")
 
-    datasets = load_datasets()
-    ds = find_dataset_by_id(dataset_id, datasets)
+    ds = await asyncio.to_thread(find_dataset_by_id, dataset_id)
     if not ds:
         raise HTTPException(status_code=404, detail="Dataset not found")
 
     try:
-        r = requests.get(host_link, timeout=10)
-        r.raise_for_status()
-        hosted_bytes = r.content
-        hosted_hash = compute_sha256(hosted_bytes)
+        # Reject on size/first-block mismatch before downloading the whole file
+        if not await prefix_matches(app.state.http, host_link, ds):
+            raise HTTPException(status_code=400, detail="File hash mismatch.")
+        hosted_hash = await fetch_sha256(app.state.http, host_link)
         if hosted_hash != ds.hash:
             raise HTTPException(status_code=400, detail="File hash mismatch.")
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Error fetching contributor file: {str(e)}")
 
-    contributors = load_contributors()
-    # Check if this exact user (by email) is already a contributor for that dataset
-    existing = [c for c in contributors if c.datasetId == dataset_id and c.email == email]
-    if not existing:
-        new_c = Contributor(
-            datasetId=dataset_id,
-            name=name,
-            email=email,
-            hostLink=host_link
-        )
-        contributors.append(new_c)
-        save_contributors(contributors)
-
-    # Recompute count of verified contributors for this dataset
-    verified_for_ds = [c for c in contributors if c.datasetId == dataset_id]
-    ds.verifiedContributorHosts = len(verified_for_ds)
-
-    # Update the dataset list
-    for i, d in enumerate(datasets):
-        if d.id == dataset_id:
-            datasets[i] = ds
-            break
-    save_datasets(datasets)
+    # Bookkeeping takes the store lock, so keep it off the event loop
+    ds = await asyncio.to_thread(register_contributor, Contributor(
+        datasetId=dataset_id,
+        name=name,
+        email=email,
+        hostLink=host_link
+    ))
+    if not ds:
+        # Deleted while we were downloading
+        raise HTTPException(status_code=404, detail="Dataset not found")
 
     # If enough contributors, delete local file
     if ds.verifiedContributorHosts >= 5:
@@ -305,33 +708,53 @@ def contribute(body: dict = Body(...)):
 
     return {"message": "Contributor verified and saved"}
 
-@app.get("/api/files/{dataset_id}")
-def download_file(dataset_id: str):
+@app.api_route("/api/files/{dataset_id}", methods=["GET", "HEAD"])
+def download_file(dataset_id: str, request: Request):
     """
     Return the original file for the dataset (if it still exists).
+    The content hash is used as a strong ETag, so clients presenting a
+    matching If-None-Match get a 304 instead of the file.
     If the file was already deleted (i.e., after 5 contributors),
     return a random contributor's link instead of 404.
     """
-    datasets = load_datasets()
-    ds = find_dataset_by_id(dataset_id, datasets)
+    ds = find_dataset_by_id(dataset_id)
     if not ds:
         raise HTTPException(status_code=404, detail="Dataset not found")
 
     file_path = DATASETS_FOLDER / ds.filenameOnDisk
 
-    # Check if we still have the file on disk
-    if file_path.exists():
-        # Return the file directly
+    # Check if we still have the file on disk (the stat is reused by FileResponse)
+    try:
+        stat_result = file_path.stat()
+    except FileNotFoundError:
+        stat_result = None
+
+    if stat_result is not None:
+        etag = f'"{ds.hash}"'
+        # Sent on both the 200 and the 304, so revalidated cache entries keep their lifetime
+        cache_headers = {
+            "ETag": etag,
+            # Content never changes for a given dataset id
+            "Cache-Control": "public, max-age=31536000, immutable"
+        }
+        if_none_match = request.headers.get("if-none-match")
+        # Weak comparison (RFC 9110): ignore any W/ prefix, and * matches anything
+        client_tags = [tag.strip().removeprefix("W/") for tag in (if_none_match or "").split(",")]
+        if "*" in client_tags or etag in client_tags:
+            return Response(status_code=304, headers=cache_headers)
+
+        # Return the file directly (served with sendfile where the server supports it)
         return FileResponse(
             path=file_path,
             media_type="application/octet-stream",
-            filename=ds.originalFilename
+            filename=ds.originalFilename,
+            stat_result=stat_result,
+            headers=cache_headers
         )
     else:
         # File is gone (likely deleted after reaching 5 contributors)
         # Return a random contributor link
-        all_contributors = load_contributors()
-        ds_contributors = [c for c in all_contributors if c.datasetId == dataset_id]
+        ds_contributors = contributors_for_dataset(dataset_id)
 
         if not ds_contributors:
             # No local file AND no contributors found => cannot provide anything
@@ -347,4 +770,5 @@ def download_file(dataset_id: str):
     
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run("server:app", host="0.0.0.0", port=8005, reload=True)
+    # No reloader in front of the app; loop="auto" picks uvloop when installed
+    uvicorn.run("server:app", host="0.0.0.0", port=8005, reload=False, loop="auto")